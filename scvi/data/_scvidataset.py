@@ -97,11 +97,13 @@ class ScviDataset(Dataset):
         for key, dtype in self.attributes_and_types.items():
             data = self.data[key]
             if isinstance(data, np.ndarray):
-                data_numpy[key] = data[idx].astype(dtype)
+                data_numpy[key] = data[idx].astype(dtype, copy=False)
             elif isinstance(data, pd.DataFrame):
-                data_numpy[key] = data.iloc[idx, :].to_numpy().astype(dtype)
+                data_numpy[key] = data.iloc[idx, :].to_numpy().astype(dtype, copy=False)
             else:
-                data_numpy[key] = data[idx].toarray().astype(dtype)
+                # cast the sparse minibatch before densifying it, so only the
+                # nonzero values are converted and a single dense array is built
+                data_numpy[key] = data[idx].astype(dtype, copy=False).toarray()
 
         return data_numpy
 
@@ -58,12 +58,15 @@ class SemiSupervisedDataLoader(ConcatDataLoader):
         labels_obs_key = adata.uns["_scvi"]["categorical_mappings"][key]["original_key"]
 
         # save a nested list of the indices per labeled category
+        # group the indices by label with a single stable sort rather than
+        # scanning all observations once per label
         self.labeled_locs = []
-        labels = np.unique(adata.obs[labels_obs_key][indices])
-        for label in labels:
+        labels = np.asarray(adata.obs[labels_obs_key])[indices]
+        unique_labels, codes = np.unique(labels, return_inverse=True)
+        order = np.argsort(codes, kind="stable")
+        splits = np.cumsum(np.bincount(codes, minlength=len(unique_labels)))[:-1]
+        for label, label_loc in zip(unique_labels, np.split(indices[order], splits)):
             if label != unlabeled_category:
-                label_loc_idx = np.where(adata.obs[labels_obs_key][indices] == label)[0]
-                label_loc = indices[label_loc_idx]
                 self.labeled_locs.append(label_loc)
         labelled_idx = self.subsample_labels()
 
@@ -83,6 +86,11 @@ class SemiSupervisedDataLoader(ConcatDataLoader):
         # self.dataloaders[1] iterates over the labelled_indices
         # change the indices of the labelled set
         self.dataloaders[1].indices = labelled_idx
+        # the sampler is iterated in the main process, so updating it in place
+        # takes effect next epoch without restarting any loader workers
+        sampler = self.dataloaders[1].sampler
+        sampler.indices = labelled_idx
+        sampler.n_obs = len(labelled_idx)
 
     def subsample_labels(self):
         """Subsamples each label class by taking up to n_samples_per_label samples per class."""
@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
 from anndata import AnnData
@@ -10,6 +10,9 @@ from scvi.external.stereoscope._module import RNADeconv, SpatialDeconv
 from scvi.lightning import VAETask
 from scvi.model.base import BaseModelClass
 
+# keep loader workers and their prefetch queue alive across epochs
+_DL_KWARGS = {"num_workers": 2, "persistent_workers": True, "prefetch_factor": 4}
+
 
 class RNAStereoscope(BaseModelClass):
     """
@@ -35,6 +38,8 @@ class RNAStereoscope(BaseModelClass):
     >>> stereo_params = stereo.get_params()
     """
 
+    _dl_kwargs = _DL_KWARGS
+
     def __init__(
         self,
         sc_adata: AnnData,
@@ -50,23 +55,26 @@ class RNAStereoscope(BaseModelClass):
             n_labels=self.n_labels,
             **model_kwargs,
         )
-        self._model_summary_string = (
-            "RNADeconv Model with params: \nn_genes: {}, n_labels: {}"
-        ).format(
-            self.n_genes,
-            self.n_labels,
-        )
         self.init_params_ = self._get_init_params(locals())
 
     def get_params(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         Returns the parameters of the RNA model used for deconvolution.
 
+        Both arrays are float32, in the order (W, px_o):
+
+        - W is the first parameter of the NB distribution for each cell type (n_genes x n_labels).
         - px_o is the second parameter of the NB distribution (n_genes)
-        - W is the first parameter of the NB distribution for each cell type (n_labels x n_genes).
         """
         return self.model.get_params()
 
+    @property
+    def _model_summary_string(self):
+        return (
+            "RNADeconv Model with params: \n"
+            f"n_genes: {self.n_genes}, n_labels: {self.n_labels}"
+        )
+
     @property
     def _task_class(self):
         return VAETask
@@ -100,13 +108,13 @@ class SpatialStereoscope(BaseModelClass):
     --------
     >>> st_adata = anndata.read_h5ad(path_to_st_anndata)
     >>> scvi.data.setup_anndata(st_adata)
-    >>> st_adata.obs["indices"] = np.arange(st_adata.n_obs)
-    >>> register_tensor_from_anndata(st_adata, "ind_x", "obs", "indices")
     >>> stereo = scvi.external.SpatialStereoscope(st_adata, sc_params)
     >>> stereo.train()
     >>> st_adata.obs["deconv"] = stereo.get_proportions()
     """
 
+    _dl_kwargs = _DL_KWARGS
+
     def __init__(
         self,
         st_adata: AnnData,
@@ -115,24 +123,22 @@ class SpatialStereoscope(BaseModelClass):
         prior_weight: Literal["n_obs", "minibatch"] = "n_obs",
         **model_kwargs,
     ):
-        st_adata.obs["_indices"] = np.arange(st_adata.n_obs)
-        register_tensor_from_anndata(st_adata, "ind_x", "obs", "_indices")
+        st_adata.obsm["_indices"] = np.arange(st_adata.n_obs, dtype=np.int32)[:, None]
+        register_tensor_from_anndata(st_adata, "ind_x", "obsm", "_indices")
         super().__init__(st_adata, use_gpu=use_gpu)
+        self.n_spots = st_adata.n_obs
 
         self.model = SpatialDeconv(
-            n_spots=st_adata.n_obs,
+            n_spots=self.n_spots,
             params=params,
             prior_weight=prior_weight,
             **model_kwargs,
         )
-        self._model_summary_string = (
-            "RNADeconv Model with params: \nn_spots: {}"
-        ).format(
-            st_adata.n_obs,
-        )
         self.init_params_ = self._get_init_params(locals())
 
-    def get_proportions(self, keep_noise=False) -> np.ndarray:
+    def get_proportions(
+        self, keep_noise=False, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """
         Returns the estimated cell type proportion for the spatial data. Shape is n_cells x n_labels OR n_cells x (n_labels + 1) if keep_noise
 
@@ -140,8 +146,15 @@ class SpatialStereoscope(BaseModelClass):
         -----------
         keep_noise
             whether to account for the noise term as a standalone cell type in the proportion estimate.
+        out
+            optional preallocated array of the output shape to write the proportions into,
+            e.g. ``stereo.get_proportions(out=st_adata.obsm["deconv"])``.
         """
-        return self.model.get_proportions(keep_noise)
+        return self.model.get_proportions(keep_noise, out=out)
+
+    @property
+    def _model_summary_string(self):
+        return f"SpatialDeconv Model with params: \nn_spots: {self.n_spots}"
 
     @property
     def _task_class(self):
@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
 import torch
@@ -56,7 +56,10 @@ class RNADeconv(AbstractVAE):
         type
             list of tensor
         """
-        return self.W.cpu().numpy(), self.px_o.cpu().numpy()
+        return (
+            self.W.cpu().numpy().astype(np.float32, copy=False),
+            self.px_o.cpu().numpy().astype(np.float32, copy=False),
+        )
 
     def _get_inference_input(self, tensors):
         # we perform MAP here, so there is nothing to infer
@@ -159,8 +162,10 @@ class SpatialDeconv(AbstractVAE):
         self.beta = torch.nn.Parameter(0.01 * torch.randn(self.n_genes))
 
     @torch.no_grad()
-    def get_proportions(self, keep_noise=False) -> np.ndarray:
-        """Returns the loadings."""
+    def get_proportions(
+        self, keep_noise=False, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Returns the loadings, written into `out` if provided."""
         # get estimated unadjusted proportions
         res = (
             torch.nn.functional.softplus(self.V).cpu().numpy().T
@@ -169,8 +174,7 @@ class SpatialDeconv(AbstractVAE):
         if not keep_noise:
             res = res[:, :-1]
         # normalize to obtain adjusted proportions
-        res = res / res.sum(axis=1).reshape(-1, 1)
-        return res
+        return np.divide(res, res.sum(axis=1).reshape(-1, 1), out=out)
 
     def _get_inference_input(self, tensors):
         # we perform MAP here, so there is nothing to infer
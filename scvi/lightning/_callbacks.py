@@ -1,4 +1,5 @@
 import warnings
+from typing import Optional
 
 import numpy as np
 import torch
@@ -29,6 +30,12 @@ class SaveBestState(Callback):
         one of ["min", "max"].
     period
         Interval (number of epochs) between checkpoints.
+    snapshot_dtype
+        If not `None`, floating point tensors of the saved state are stored in this
+        dtype (e.g., `torch.float16` to halve the snapshot memory) and cast back to
+        the dtype of the model when restored. Snapshots of GPU models are kept in
+        pinned memory, but with a different `snapshot_dtype` the restore casts
+        through a pageable CPU temporary, so the transfer does not benefit from it.
 
     Examples
     --------
@@ -42,14 +49,17 @@ class SaveBestState(Callback):
         mode: str = "min",
         verbose=False,
         period=1,
+        snapshot_dtype: Optional[torch.dtype] = None,
     ):
         super().__init__()
 
         self.monitor = monitor
         self.verbose = verbose
         self.period = period
+        self.snapshot_dtype = snapshot_dtype
         self.epochs_since_last_check = 0
         self.best_model_state = None
+        self._warned_missing = False
 
         if mode not in ["min", "max"]:
             raise ValueError(
@@ -60,50 +70,70 @@ class SaveBestState(Callback):
             self.monitor_op = np.less
             self.best_model_metric_val = np.Inf
             self.mode = "min"
-        elif mode == "max":
+        else:
             self.monitor_op = np.greater
             self.best_model_metric_val = -np.Inf
             self.mode = "max"
-        else:
-            if "acc" in self.monitor or self.monitor.startswith("fmeasure"):
-                self.monitor_op = np.greater
-                self.best_model_metric_val = -np.Inf
-                self.mode = "max"
-            else:
-                self.monitor_op = np.less
-                self.best_model_metric_val = np.Inf
-                self.mode = "min"
 
     def check_monitor_top(self, current):
         return self.monitor_op(current, self.best_model_metric_val)
 
+    def _copy_to_cpu(self, tensor, pin_memory: Optional[bool] = None):
+        if pin_memory is None:
+            pin_memory = tensor.is_cuda
+        dtype = tensor.dtype
+        if self.snapshot_dtype is not None and tensor.is_floating_point():
+            dtype = self.snapshot_dtype
+        if pin_memory:
+            # page-locked memory lets the restore copy go straight to the device
+            try:
+                snapshot = torch.empty(tensor.shape, dtype=dtype, pin_memory=True)
+                return snapshot.copy_(tensor)
+            except RuntimeError:
+                pass
+        return tensor.to("cpu", dtype=dtype, copy=True)
+
+    def _save_state(self, model):
+        self.best_model_state = {
+            k: self._copy_to_cpu(v) for k, v in model.state_dict().items()
+        }
+
     def on_epoch_end(self, trainer, pl_module):
-        logs = trainer.callback_metrics
         self.epochs_since_last_check += 1
+        if self.epochs_since_last_check < self.period:
+            return
+        self.epochs_since_last_check = 0
 
-        if self.epochs_since_last_check >= self.period:
-            self.epochs_since_last_check = 0
-            current = logs.get(self.monitor)
-
-            if current is None:
+        current = trainer.callback_metrics.get(self.monitor)
+        if current is None:
+            if not self._warned_missing:
                 warnings.warn(
                     f"Can save best model state only with {self.monitor} available,"
                     " skipping.",
                     RuntimeWarning,
                 )
-            else:
-                if isinstance(current, torch.Tensor):
-                    current = current.item()
-                if self.check_monitor_top(current):
-                    self.best_model_state = pl_module.model.state_dict()
-                    self.best_model_metric_val = current
-
-                    if self.verbose:
-                        rank_zero_info(
-                            f"\nEpoch {trainer.current_epoch:05d}: {self.monitor} reached."
-                            f" Model best state updated."
-                        )
+                self._warned_missing = True
+            return
+
+        if isinstance(current, torch.Tensor):
+            current = current.item()
+        if self.check_monitor_top(current):
+            self._save_state(pl_module.model)
+            self.best_model_metric_val = current
+
+            if self.verbose:
+                rank_zero_info(
+                    f"\nEpoch {trainer.current_epoch:05d}: {self.monitor} reached."
+                    f" Model best state updated."
+                )
 
     def on_train_end(self, trainer, pl_module):
-
-        pl_module.model.load_state_dict(self.best_model_state)
+        if self.best_model_state is None:
+            return
+        state = pl_module.model.state_dict()
+        pl_module.model.load_state_dict(
+            {
+                k: v.to(pl_module.device, dtype=state[k].dtype, non_blocking=True)
+                for k, v in self.best_model_state.items()
+            }
+        )
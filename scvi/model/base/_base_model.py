@@ -11,6 +11,7 @@ import torch
 from anndata import AnnData
 from rich.text import Text
 from sklearn.model_selection._split import _validate_shuffle_split
+from torch.utils.data import DataLoader
 
 from scvi import _CONSTANTS, settings
 from scvi.data import get_from_registry, transfer_anndata_setup
@@ -24,8 +25,20 @@ from ._utils import _initialize_model, _load_saved_files, _validate_var_names
 
 logger = logging.getLogger(__name__)
 
+# `persistent_workers` and `prefetch_factor` were added in torch 1.7
+_DL_SUPPORTS_WORKER_KWARGS = (
+    "persistent_workers" in inspect.signature(DataLoader).parameters
+)
+
 
 class BaseModelClass(ABC):
+    # model-specific worker defaults for the data loaders built by `_make_scvi_dl()`,
+    # overridden by explicit kwargs; models setting them load datasets under
+    # 2048 cells in the main process
+    _dl_kwargs = {}
+    # models may override this with a property built on demand
+    _model_summary_string = ""
+
     def __init__(self, adata: Optional[AnnData] = None, use_gpu: Optional[bool] = None):
         if adata is not None:
             if "_scvi" not in adata.uns.keys():
@@ -40,7 +53,6 @@ class BaseModelClass(ABC):
         self.is_trained_ = False
         cuda_avail = torch.cuda.is_available()
         self.use_gpu = cuda_avail if use_gpu is None else (use_gpu and cuda_avail)
-        self._model_summary_string = ""
         self.train_indices_ = None
         self.test_indices_ = None
         self.validation_indices_ = None
@@ -79,8 +91,26 @@ class BaseModelClass(ABC):
         if scvi_dl_class is None:
             scvi_dl_class = self._data_loader_cls
 
+        if self._dl_kwargs:
+            if len(indices) < 2048:
+                # spawning workers costs more than loading a small dataset
+                data_loader_kwargs.setdefault("num_workers", 0)
+            else:
+                dl_kwargs = dict(self._dl_kwargs)
+                if "num_workers" in dl_kwargs:
+                    dl_kwargs["num_workers"] = max(
+                        dl_kwargs["num_workers"], settings.dl_num_workers
+                    )
+                if not _DL_SUPPORTS_WORKER_KWARGS:
+                    dl_kwargs.pop("persistent_workers", None)
+                    dl_kwargs.pop("prefetch_factor", None)
+                data_loader_kwargs = {**dl_kwargs, **data_loader_kwargs}
         if "num_workers" not in data_loader_kwargs:
             data_loader_kwargs.update({"num_workers": settings.dl_num_workers})
+        if data_loader_kwargs["num_workers"] == 0:
+            # these options are only valid with worker processes
+            data_loader_kwargs.pop("persistent_workers", None)
+            data_loader_kwargs.pop("prefetch_factor", None)
 
         dl = scvi_dl_class(
             adata,
@@ -316,6 +346,13 @@ class BaseModelClass(ABC):
             self.trainer.fit(self._pl_task, train_dl)
         else:
             self.trainer.fit(self._pl_task, train_dl, val_dl)
+        # the trainer keeps references to its loaders, so persistent workers
+        # would otherwise outlive training
+        for dl in (train_dl, val_dl):
+            iterator = getattr(dl, "_iterator", None)
+            if iterator is not None and hasattr(iterator, "_shutdown_workers"):
+                iterator._shutdown_workers()
+                dl._iterator = None
         try:
             self.history_ = self.trainer.logger.history
         except AttributeError:
@@ -1,7 +1,10 @@
 import numpy as np
+import pytest
 
+import scvi
 from scvi.data import synthetic_iid
 from scvi.external import RNAStereoscope, SpatialStereoscope
+from scvi.model.base._base_model import _DL_SUPPORTS_WORKER_KWARGS
 
 
 def test_stereoscope(save_path):
@@ -27,3 +30,48 @@ def test_stereoscope(save_path):
     st_model.save(save_path, overwrite=True, save_anndata=True)
     st_model = SpatialStereoscope.load(save_path)
     st_model.get_proportions()
+    out = np.empty((dataset.n_obs, 5), dtype=np.float32)
+    assert st_model.get_proportions(out=out) is out
+    np.testing.assert_allclose(out, st_model.get_proportions(), rtol=1e-6)
+    out = np.empty((dataset.n_obs, 6), dtype=np.float32)
+    assert st_model.get_proportions(keep_noise=True, out=out) is out
+    np.testing.assert_allclose(
+        out, st_model.get_proportions(keep_noise=True), rtol=1e-6
+    )
+
+
+@pytest.mark.skipif(
+    not _DL_SUPPORTS_WORKER_KWARGS, reason="persistent workers require torch>=1.7"
+)
+def test_stereoscope_data_loader_kwargs(monkeypatch):
+    small = synthetic_iid(n_labels=5)
+    large = synthetic_iid(batch_size=1100, n_labels=5)
+
+    # small datasets are loaded in the main process unless asked otherwise
+    monkeypatch.setattr(scvi.settings, "dl_num_workers", 2)
+    small_model = RNAStereoscope(small)
+    dl = small_model._make_scvi_dl(small)
+    assert dl.num_workers == 0
+    assert dl.persistent_workers is False
+    dl = small_model._make_scvi_dl(small, num_workers=1)
+    assert dl.num_workers == 1
+
+    # large datasets use persistent workers by default
+    monkeypatch.setattr(scvi.settings, "dl_num_workers", 0)
+    model = RNAStereoscope(large)
+    dl = model._make_scvi_dl(large)
+    assert dl.num_workers == 2
+    assert dl.persistent_workers is True
+    assert dl.prefetch_factor == 4
+    monkeypatch.setattr(scvi.settings, "dl_num_workers", 4)
+    assert model._make_scvi_dl(large).num_workers == 4
+
+    # explicit kwargs override the model defaults
+    dl = model._make_scvi_dl(large, persistent_workers=False, prefetch_factor=2)
+    assert dl.persistent_workers is False
+    assert dl.prefetch_factor == 2
+
+    # worker-only options are dropped without worker processes
+    dl = model._make_scvi_dl(large, num_workers=0)
+    assert dl.num_workers == 0
+    assert dl.persistent_workers is False
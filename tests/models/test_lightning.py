@@ -1,8 +1,21 @@
+import pytest
+import torch
+
 from scvi.data import synthetic_iid
 from scvi.model import SCVI
 from scvi.lightning._callbacks import SaveBestState
 
 
+class _RecordBestState(SaveBestState):
+    """Keeps an independent full copy of the state at each improvement."""
+
+    def _save_state(self, model):
+        super()._save_state(model)
+        self.reference_state = {
+            k: v.detach().cpu().clone() for k, v in model.state_dict().items()
+        }
+
+
 def test_save_best_state_callback(save_path):
 
     n_latent = 5
@@ -10,3 +23,73 @@ def test_save_best_state_callback(save_path):
     model = SCVI(adata, n_latent=n_latent)
     callbacks = [SaveBestState(verbose=True)]
     model.train(3, check_val_every_n_epoch=1, train_size=0.5, callbacks=callbacks)
+
+
+def test_save_best_state_restores_best_epoch():
+    adata = synthetic_iid()
+    model = SCVI(adata)
+    callback = _RecordBestState()
+    model.train(5, check_val_every_n_epoch=1, train_size=0.5, callbacks=[callback])
+
+    restored = model.model.state_dict()
+    assert restored.keys() == callback.reference_state.keys()
+    # includes BatchNorm running statistics, not only parameters
+    assert any(k.endswith("running_mean") for k in restored)
+    for name, value in restored.items():
+        assert torch.equal(value.cpu(), callback.reference_state[name]), name
+
+
+def test_save_best_state_snapshot_dtype():
+    adata = synthetic_iid()
+    model = SCVI(adata)
+    callback = SaveBestState(snapshot_dtype=torch.float16)
+    model.train(2, check_val_every_n_epoch=1, train_size=0.5, callbacks=[callback])
+
+    for name, value in callback.best_model_state.items():
+        if name.endswith("num_batches_tracked"):
+            assert value.dtype == torch.int64
+        else:
+            assert value.dtype == torch.float16, name
+    assert any(k.endswith("num_batches_tracked") for k in callback.best_model_state)
+    for param in model.model.parameters():
+        assert param.dtype == torch.float32
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="requires CUDA")
+def test_save_best_state_pinned_memory():
+    adata = synthetic_iid()
+    model = SCVI(adata, use_gpu=True)
+    callback = SaveBestState()
+    model.train(2, check_val_every_n_epoch=1, train_size=0.5, callbacks=[callback])
+
+    for name, value in callback.best_model_state.items():
+        assert value.is_pinned(), name
+
+
+def test_save_best_state_pinned_memory_fallback(monkeypatch):
+    empty = torch.empty
+
+    def empty_without_pinning(*args, **kwargs):
+        if kwargs.get("pin_memory"):
+            raise RuntimeError("cannot pin memory")
+        return empty(*args, **kwargs)
+
+    copy_to_cpu = SaveBestState._copy_to_cpu
+
+    def copy_to_cpu_pinned(self, tensor, pin_memory=None):
+        return copy_to_cpu(self, tensor, pin_memory=True)
+
+    monkeypatch.setattr(torch, "empty", empty_without_pinning)
+    monkeypatch.setattr(_RecordBestState, "_copy_to_cpu", copy_to_cpu_pinned)
+
+    adata = synthetic_iid()
+    model = SCVI(adata, use_gpu=False)
+    callback = _RecordBestState()
+    model.train(3, check_val_every_n_epoch=1, train_size=0.5, callbacks=[callback])
+
+    restored = model.model.state_dict()
+    for name, value in callback.best_model_state.items():
+        assert not value.is_pinned(), name
+        assert value.data_ptr() != restored[name].data_ptr(), name
+        assert torch.equal(value, callback.reference_state[name]), name
+        assert torch.equal(restored[name], callback.reference_state[name]), name
@@ -221,6 +221,9 @@ def test_semisupervised_dataloader():
     # test label resampling
     n_samples_per_label = 10
     a = synthetic_iid()
+    # register the cell index so the loaded batches show which cells were sampled
+    a.obs["_indices"] = np.arange(a.n_obs)
+    scvi.data.register_tensor_from_anndata(a, "ind_x", "obs", "_indices")
     dl = SemiSupervisedDataLoader(
         a,
         indices=np.arange(a.n_obs),
@@ -233,6 +236,12 @@ def test_semisupervised_dataloader():
     dl.resample_labels()
     resampled_labeled_dl_idx = dl.dataloaders[1].indices
     assert len(resampled_labeled_dl_idx) == n_samples_per_label * n_labels
+    loaded_idx = np.concatenate(
+        [tensors["ind_x"].numpy().ravel() for tensors in dl.dataloaders[1]]
+    )
+    np.testing.assert_array_equal(
+        np.sort(loaded_idx), np.sort(resampled_labeled_dl_idx)
+    )
     # check labeled indices was actually resampled
     assert np.sum(labeled_dl_idx == resampled_labeled_dl_idx) != len(labeled_dl_idx)
 